@@ -1,11 +1,93 @@
 # INTERACTIVE GENAI REPORT GENERATOR FOR RENEWABLE ENERGY
 # Using your actual CNN+LSTM model performance and database structure
 
-import pandas as pd
+import argparse
+import functools
 import json
-import matplotlib.pyplot as plt
-import numpy as np
+import math
+import sys
+from dataclasses import dataclass
 from datetime import datetime
+from types import MappingProxyType
+
+
+def _impact_core(pv_r2, wind_r2, adjustment, avg_ghi, avg_demand):
+    """Pure scalar impact math; order matches InteractiveRenewableEnergyGenAI._IMPACT_KEYS"""
+    # Solar potential adjustment, normalized to 400 W/m² GHI
+    ghi_factor = min(1.5, avg_ghi / 400)
+
+    return (
+        # Economic metrics
+        (pv_r2 * 25 + wind_r2 * 15) * adjustment,
+        avg_demand * 0.12 * adjustment,  # 12% of demand value
+        # Energy metrics
+        (pv_r2 + wind_r2) * 45,
+        (pv_r2 * 40 + wind_r2 * 30) * ghi_factor,
+        pv_r2 * 20 * adjustment,
+        # Environmental metrics
+        avg_demand * 0.8 * adjustment,
+        avg_demand * 15 * adjustment,
+        # Social metrics
+        max(18.0, 36 - (pv_r2 * 12)),
+    )
+
+@functools.lru_cache(maxsize=None)
+def _jit_impact_core():
+    """_impact_core compiled by numba, or the plain function when numba is not installed.
+
+    Importing numba and compiling cost ~0.3 s, which only pays off when many communities
+    are evaluated in one process, so this is opt-in via calculate_personalized_impact(..., jit=True).
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _impact_core
+    return njit(cache=True)(_impact_core)
+
+
+@dataclass(frozen=True)
+class ModelMetrics:
+    """Performance of the trained CNN+LSTM model"""
+    window_size: int = 48
+    architecture: str = 'CNN: tanh | LSTM: sigmoid/sigmoid | Dense: elu'
+    pv_mae: float = 367.709
+    pv_rmse: float = 547.014
+    pv_r2: float = 0.983
+    wind_mae: float = 178.476
+    wind_rmse: float = 221.862
+    wind_r2: float = 0.965
+
+# Shared, read-only constants; every generator instance binds these instead of rebuilding them
+_MODEL_METRICS = ModelMetrics()
+
+# Templates based on your database features
+_COMMUNITY_TEMPLATES = MappingProxyType({
+    'rural_agricultural': MappingProxyType({
+        'description': 'Rural areas with agricultural focus (like your dataset)',
+        'typical_ghi_range': '0-800 W/m²',
+        'typical_wind_speed': '2-6 m/s',
+        'energy_pattern': 'Seasonal variation with agriculture cycles'
+    }),
+    'urban_mixed': MappingProxyType({
+        'description': 'Urban areas with mixed energy demand',
+        'typical_ghi_range': '0-900 W/m²',
+        'typical_wind_speed': '1-4 m/s', 
+        'energy_pattern': 'Consistent high demand with peak hours'
+    }),
+    'industrial_zone': MappingProxyType({
+        'description': 'Industrial areas with high energy consumption',
+        'typical_ghi_range': '0-850 W/m²',
+        'typical_wind_speed': '3-7 m/s',
+        'energy_pattern': '24/7 high baseline demand'
+    }),
+    'coastal_area': MappingProxyType({
+        'description': 'Coastal regions with good wind potential',
+        'typical_ghi_range': '0-950 W/m²',
+        'typical_wind_speed': '4-10 m/s',
+        'energy_pattern': 'High wind potential, moderate solar'
+    })
+})
+
 
 print("🌱 INTERACTIVE AI FOR SOCIAL GOOD REPORT GENERATOR")
 print("="*60)
@@ -13,47 +95,87 @@ print("Using your CNN+LSTM model: R²=0.983 (PV), R²=0.965 (Wind)")
 print("="*60)
 
 class InteractiveRenewableEnergyGenAI:
-    def __init__(self):
-        self.model_metrics = {
-            'window_size': 48,
-            'architecture': 'CNN: tanh | LSTM: sigmoid/sigmoid | Dense: elu',
-            'pv_mae': 367.709,
-            'pv_rmse': 547.014,
-            'pv_r2': 0.983,
-            'wind_mae': 178.476,
-            'wind_rmse': 221.862,
-            'wind_r2': 0.965
-        }
+    _IMPACT_KEYS = (
+        'cost_reduction_percent',
+        'monthly_savings_inr',
+        'reliability_improvement',
+        'renewable_penetration',
+        'peak_reduction',
+        'co2_reduction_tons',
+        'diesel_displacement_liters',
+        'payback_months',
+    )
+    _CONFIG_TEXT_FIELDS = ('name', 'type', 'region', 'population', 'season_pattern', 'main_challenge', 'special_needs')
+    _CONFIG_NUMERIC_FIELDS = ('avg_demand', 'peak_demand', 'avg_ghi', 'avg_wind_speed')
+    # Defaults for optional community fields, shared by the prompts and --config files
+    _COMMUNITY_DEFAULTS = {
+        'region': 'Unknown Region',
+        'population': '10,000',
+        'season_pattern': 'Balanced across seasons',
+        'main_challenge': 'Unreliable grid supply',
+        'special_needs': 'General community needs'
+    }
+
+    def __init__(self, interactive=False):
+        self.interactive = interactive
+        self._piped_answers = None
+        self.metrics = _MODEL_METRICS
         self.setup_community_templates()
     
     def setup_community_templates(self):
         """Setup templates based on your database features"""
-        self.community_templates = {
-            'rural_agricultural': {
-                'description': 'Rural areas with agricultural focus (like your dataset)',
-                'typical_ghi_range': '0-800 W/m²',
-                'typical_wind_speed': '2-6 m/s',
-                'energy_pattern': 'Seasonal variation with agriculture cycles'
-            },
-            'urban_mixed': {
-                'description': 'Urban areas with mixed energy demand',
-                'typical_ghi_range': '0-900 W/m²',
-                'typical_wind_speed': '1-4 m/s', 
-                'energy_pattern': 'Consistent high demand with peak hours'
-            },
-            'industrial_zone': {
-                'description': 'Industrial areas with high energy consumption',
-                'typical_ghi_range': '0-850 W/m²',
-                'typical_wind_speed': '3-7 m/s',
-                'energy_pattern': '24/7 high baseline demand'
-            },
-            'coastal_area': {
-                'description': 'Coastal regions with good wind potential',
-                'typical_ghi_range': '0-950 W/m²',
-                'typical_wind_speed': '4-10 m/s',
-                'energy_pattern': 'High wind potential, moderate solar'
-            }
-        }
+        self.community_templates = _COMMUNITY_TEMPLATES
+        
+        # The templates never change, so the selection menu is rendered once here
+        self._template_keys = tuple(self.community_templates.keys())
+        self._templates_menu = "\n".join(
+            f"{i}. {key.replace('_', ' ').title()} - {template['description']}\n"
+            f"   GHI: {template['typical_ghi_range']}, Wind: {template['typical_wind_speed']}"
+            for i, (key, template) in enumerate(self.community_templates.items(), 1)
+        )
+    
+    def _ask(self, prompt, default, cast=str):
+        """Ask one question, falling back to the default when the answer is blank"""
+        if self._piped_answers is None:
+            answer = input(prompt)
+        else:
+            sys.stdout.write(prompt)
+            answer = next(self._piped_answers, '')
+        return cast(answer.strip() or default)
+    
+    def load_community_config(self, path):
+        """Load community information from a JSON file instead of prompting for it"""
+        with open(path, encoding='utf-8') as f:
+            config = json.load(f)
+        if not isinstance(config, dict):
+            raise ValueError(f"{path}: expected a JSON object")
+        
+        missing = [key for key in ('name', 'type', *self._CONFIG_NUMERIC_FIELDS) if key not in config]
+        if missing:
+            raise ValueError(f"{path}: missing required field(s): {', '.join(missing)}")
+        
+        community_data = {**self._COMMUNITY_DEFAULTS, **config}
+        for key in self._CONFIG_TEXT_FIELDS:
+            if not isinstance(community_data[key], str):
+                raise ValueError(f"{path}: {key} must be a string, got {community_data[key]!r}")
+        if community_data['type'] not in self.community_templates:
+            raise ValueError(f"{path}: unknown community type {community_data['type']!r} "
+                             f"(expected one of: {', '.join(self.community_templates)})")
+        for key in self._CONFIG_NUMERIC_FIELDS:
+            value = community_data[key]
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+                raise ValueError(f"{path}: {key} must be a finite number, got {value!r}")
+            community_data[key] = float(value)
+        return community_data
+    
+    def load_answers(self, path):
+        """Read all prompt answers up front, one per line, from a file or from stdin when path is '-'"""
+        if path == '-':
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(path, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        self._piped_answers = iter(lines)
     
     def get_user_input(self):
         """Interactive user input based on your database features"""
@@ -64,18 +186,16 @@ class InteractiveRenewableEnergyGenAI:
         community_data = {}
         
         # Basic information
-        community_data['name'] = input("Community Name: ").strip() or "Sample Community"
-        community_data['region'] = input("Region/State: ").strip() or "Unknown Region"
+        community_data['name'] = self._ask("Community Name: ", "Sample Community")
+        community_data['region'] = self._ask("Region/State: ", self._COMMUNITY_DEFAULTS['region'])
         
         # Community type based on energy patterns
         print("\n🏘️  SELECT COMMUNITY TYPE (based on energy patterns):")
-        for i, (key, template) in enumerate(self.community_templates.items(), 1):
-            print(f"{i}. {key.replace('_', ' ').title()} - {template['description']}")
-            print(f"   GHI: {template['typical_ghi_range']}, Wind: {template['typical_wind_speed']}")
+        print(self._templates_menu)
         
-        type_choice = input(f"\nChoose community type (1-{len(self.community_templates)}): ").strip()
-        if type_choice.isdigit() and 1 <= int(type_choice) <= len(self.community_templates):
-            community_type = list(self.community_templates.keys())[int(type_choice)-1]
+        type_choice = self._ask(f"\nChoose community type (1-{len(self._template_keys)}): ", "")
+        if type_choice.isdigit() and 1 <= int(type_choice) <= len(self._template_keys):
+            community_type = self._template_keys[int(type_choice)-1]
             community_data['type'] = community_type
             template = self.community_templates[community_type]
         else:
@@ -83,28 +203,23 @@ class InteractiveRenewableEnergyGenAI:
             template = self.community_templates['rural_agricultural']
         
         # Population and current energy usage (based on your Electric_demand column)
-        community_data['population'] = input("\n👥 Approximate population: ").strip() or "10,000"
+        community_data['population'] = self._ask("\n👥 Approximate population: ", self._COMMUNITY_DEFAULTS['population'])
         
         # Current energy situation (based on your database patterns)
         print(f"\n⚡ CURRENT ENERGY PROFILE (based on your dataset patterns):")
         print(f"Typical for {community_data['type']}: {template['energy_pattern']}")
         
-        avg_demand = input("Average electric demand (kW) [22000]: ").strip() or "22000"
-        peak_demand = input("Peak electric demand (kW) [35000]: ").strip() or "35000"
-        community_data['avg_demand'] = float(avg_demand)
-        community_data['peak_demand'] = float(peak_demand)
+        community_data['avg_demand'] = self._ask("Average electric demand (kW) [22000]: ", "22000", float)
+        community_data['peak_demand'] = self._ask("Peak electric demand (kW) [35000]: ", "35000", float)
         
         # Renewable energy potential (based on your GHI, Wind_speed columns)
         print(f"\n🌞 SOLAR POTENTIAL (based on GHI - Global Horizontal Irradiance)")
         print(f"Typical range for this type: {template['typical_ghi_range']}")
-        avg_ghi = input("Average GHI (W/m²) [400]: ").strip() or "400"
+        community_data['avg_ghi'] = self._ask("Average GHI (W/m²) [400]: ", "400", float)
         
         print(f"\n💨 WIND POTENTIAL (based on Wind_speed)")
         print(f"Typical range for this type: {template['typical_wind_speed']}")
-        avg_wind = input("Average wind speed (m/s) [3.0]: ").strip() or "3.0"
-        
-        community_data['avg_ghi'] = float(avg_ghi)
-        community_data['avg_wind_speed'] = float(avg_wind)
+        community_data['avg_wind_speed'] = self._ask("Average wind speed (m/s) [3.0]: ", "3.0", float)
         
         # Seasonal patterns (based on your Season column)
         print(f"\n📅 SEASONAL ENERGY PATTERNS (based on your Season feature)")
@@ -113,14 +228,14 @@ class InteractiveRenewableEnergyGenAI:
         print("3. Monsoon (Variable solar, moderate demand)")
         print("4. All seasons balanced")
         
-        season_pattern = input("Dominant seasonal pattern (1-4): ").strip() or "4"
+        season_pattern = self._ask("Dominant seasonal pattern (1-4): ", "")
         season_patterns = {
             '1': 'Winter dominant (Low solar, stable demand)',
             '2': 'Summer dominant (High solar, high cooling demand)',
             '3': 'Monsoon dominant (Variable solar, moderate demand)',
             '4': 'Balanced across seasons'
         }
-        community_data['season_pattern'] = season_patterns.get(season_pattern, 'Balanced across seasons')
+        community_data['season_pattern'] = season_patterns.get(season_pattern, self._COMMUNITY_DEFAULTS['season_pattern'])
         
         # Current challenges (based on your data patterns)
         print(f"\n🎯 MAIN ENERGY CHALLENGES:")
@@ -130,7 +245,7 @@ class InteractiveRenewableEnergyGenAI:
         print("4. Renewable integration")
         print("5. Multiple challenges")
         
-        challenge_choice = input("Primary challenge (1-5): ").strip() or "2"
+        challenge_choice = self._ask("Primary challenge (1-5): ", "")
         challenges = {
             '1': 'High energy costs',
             '2': 'Unreliable grid supply',
@@ -138,20 +253,19 @@ class InteractiveRenewableEnergyGenAI:
             '4': 'Renewable integration',
             '5': 'Multiple energy challenges'
         }
-        community_data['main_challenge'] = challenges.get(challenge_choice, 'Unreliable grid supply')
+        community_data['main_challenge'] = challenges.get(challenge_choice, self._COMMUNITY_DEFAULTS['main_challenge'])
         
         # Special requirements
-        special_needs = input("\n⭐ Special energy needs (healthcare, schools, industries): ").strip()
-        community_data['special_needs'] = special_needs or "General community needs"
+        community_data['special_needs'] = self._ask("\n⭐ Special energy needs (healthcare, schools, industries): ",
+                                                   self._COMMUNITY_DEFAULTS['special_needs'])
         
         return community_data
     
-    def calculate_personalized_impact(self, community_data):
-        """Calculate impact using your actual model performance"""
-        
+    def calculate_personalized_impact(self, community_data, jit=False):
+        """Calculate impact using your actual model performance; jit=True uses numba for batch runs"""
         # Base calculations from your model's exceptional performance
-        base_pv_efficiency = self.model_metrics['pv_r2']  # 0.983
-        base_wind_efficiency = self.model_metrics['wind_r2']  # 0.965
+        base_pv_efficiency = self.metrics.pv_r2  # 0.983
+        base_wind_efficiency = self.metrics.wind_r2  # 0.965
         
         # Adjust based on community characteristics
         type_factors = {
@@ -163,38 +277,26 @@ class InteractiveRenewableEnergyGenAI:
         
         adjustment = type_factors.get(community_data['type'], 1.0)
         
-        # Solar potential adjustment (based on GHI)
-        ghi_factor = min(1.5, community_data['avg_ghi'] / 400)  # Normalize to 400 W/m²
-        
-        # Wind potential adjustment  
-        wind_factor = min(1.8, community_data['avg_wind_speed'] / 3.0)  # Normalize to 3.0 m/s
-        
-        # Calculate personalized metrics
-        personalized = {
-            # Economic metrics
-            'cost_reduction_percent': (base_pv_efficiency * 25 + base_wind_efficiency * 15) * adjustment,
-            'monthly_savings_inr': community_data['avg_demand'] * 0.12 * adjustment,  # 12% of demand value
-            
-            # Energy metrics
-            'reliability_improvement': (base_pv_efficiency + base_wind_efficiency) * 45,
-            'renewable_penetration': (base_pv_efficiency * 40 + base_wind_efficiency * 30) * ghi_factor,
-            'peak_reduction': base_pv_efficiency * 20 * adjustment,
-            
-            # Environmental metrics
-            'co2_reduction_tons': community_data['avg_demand'] * 0.8 * adjustment,
-            'diesel_displacement_liters': community_data['avg_demand'] * 15 * adjustment,
-            
-            # Social metrics
-            'jobs_created': max(3, int(community_data['avg_demand'] / 5000)),  # 1 job per 5MW
-            'payback_months': max(18, 36 - (base_pv_efficiency * 12)),
-            
-            # Technical performance (from your model)
-            'prediction_accuracy_pv': base_pv_efficiency,
-            'prediction_accuracy_wind': base_wind_efficiency,
-            'prediction_error_pv': self.model_metrics['pv_mae'],
-            'prediction_error_wind': self.model_metrics['wind_mae']
-        }
-        
+        if jit:
+            # Native code does not follow Python's NaN/inf semantics (e.g. min() with NaN)
+            for key in ('avg_demand', 'avg_ghi'):
+                if not math.isfinite(community_data[key]):
+                    raise ValueError(f"{key} must be a finite number, got {community_data[key]!r}")
+            impact_core = _jit_impact_core()
+        else:
+            impact_core = _impact_core
+        personalized = dict(zip(self._IMPACT_KEYS, impact_core(
+            base_pv_efficiency, base_wind_efficiency, adjustment,
+            community_data['avg_ghi'], community_data['avg_demand']
+        )))
+        personalized['jobs_created'] = max(3, int(community_data['avg_demand'] / 5000))  # 1 job per 5MW
+
+        # Technical performance (from your model)
+        personalized['prediction_accuracy_pv'] = base_pv_efficiency
+        personalized['prediction_accuracy_wind'] = base_wind_efficiency
+        personalized['prediction_error_pv'] = self.metrics.pv_mae
+        personalized['prediction_error_wind'] = self.metrics.wind_mae
+
         return personalized
     
     def generate_technical_analysis(self, community_data, personalized_metrics):
@@ -330,16 +432,25 @@ SCALABILITY POTENTIAL:
 • Data-driven optimization continuous learning
 
 ---
-AI Model: Hybrid CNN-LSTM | Accuracy: PV {self.model_metrics['pv_r2']:.1%}, Wind {self.model_metrics['wind_r2']:.1%}
+AI Model: Hybrid CNN-LSTM | Accuracy: PV {self.metrics.pv_r2:.1%}, Wind {self.metrics.wind_r2:.1%}
 Generated for: {community_data['name']} | Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 Data Features: Time, Season, DHI, DNI, GHI, Wind_speed, Humidity, Temperature
 {'='*70}
 """
         return report
     
-    def generate_impact_dashboard(self, community_data, personalized_metrics):
-        """Generate visual impact dashboard"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+    def generate_impact_dashboard(self, community_data, personalized_metrics, filename=None):
+        """Generate visual impact dashboard and save it as a PNG"""
+        # Imported here so the prompts come up without paying matplotlib's import cost.
+        # Headless runs draw on a standalone Figure, which needs neither pyplot nor a
+        # change of the process-wide backend; pyplot is only used to show a window.
+        if self.interactive:
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(16, 12))
+        else:
+            from matplotlib.figure import Figure
+            fig = Figure(figsize=(16, 12))
+        ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
         
         # Economic Impact
         economic_labels = ['Cost Reduction', 'Monthly Savings', 'Payback Period']
@@ -352,13 +463,8 @@ Data Features: Time, Season, DHI, DNI, GHI, Wind_speed, Humidity, Temperature
         bars1 = ax1.bar(economic_labels, economic_values, color=colors, alpha=0.8)
         ax1.set_title('Economic Impact Analysis', fontweight='bold', fontsize=12)
         ax1.tick_params(axis='x', rotation=45)
-        for bar, value in zip(bars1, economic_values):
-            if bar.get_height() > 1000:  # For savings in thousands
-                ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 5, 
-                        f'₹{value:,.0f}K', ha='center', va='bottom', fontweight='bold')
-            else:
-                ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 2, 
-                        f'{value:.0f}', ha='center', va='bottom', fontweight='bold')
+        ax1.bar_label(bars1, labels=[f'₹{v:,.0f}K' if v > 1000 else f'{v:.0f}' for v in economic_values],  # Savings in thousands
+                      padding=3, fontweight='bold')
         
         # Environmental Impact
         env_labels = ['CO₂ Reduction\n(tons/year)', 'Diesel Displaced\n(liters/month)', 'Renewable %']
@@ -371,9 +477,7 @@ Data Features: Time, Season, DHI, DNI, GHI, Wind_speed, Humidity, Temperature
         bars2 = ax2.bar(env_labels, env_values, color=colors_env, alpha=0.8)
         ax2.set_title('Environmental Impact', fontweight='bold', fontsize=12)
         ax2.tick_params(axis='x', rotation=45)
-        for bar, value in zip(bars2, env_values):
-            ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 5, 
-                    f'{value:,.0f}', ha='center', va='bottom', fontweight='bold')
+        ax2.bar_label(bars2, labels=[f'{v:,.0f}' for v in env_values], padding=3, fontweight='bold')
         
         # Technical Performance
         tech_labels = ['Solar\nAccuracy', 'Wind\nAccuracy', 'Reliability\nGain']
@@ -385,9 +489,7 @@ Data Features: Time, Season, DHI, DNI, GHI, Wind_speed, Humidity, Temperature
         colors_tech = ['#f39c12', '#3498db', '#9b59b6']
         bars3 = ax3.bar(tech_labels, tech_values, color=colors_tech, alpha=0.8)
         ax3.set_title('Technical Performance (%)', fontweight='bold', fontsize=12)
-        for bar, value in zip(bars3, tech_values):
-            ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1, 
-                    f'{value:.1f}%', ha='center', va='bottom', fontweight='bold')
+        ax3.bar_label(bars3, labels=[f'{v:.1f}%' for v in tech_values], padding=3, fontweight='bold')
         
         # Social Impact
         social_labels = ['Jobs Created', 'Peak Reduction', 'Cost Savings %']
@@ -400,33 +502,38 @@ Data Features: Time, Season, DHI, DNI, GHI, Wind_speed, Humidity, Temperature
         bars4 = ax4.bar(social_labels, social_values, color=colors_social, alpha=0.8)
         ax4.set_title('Social & Operational Impact', fontweight='bold', fontsize=12)
         ax4.tick_params(axis='x', rotation=45)
-        for bar, value in zip(bars4, social_values):
-            ax4.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1, 
-                    f'{value:.0f}', ha='center', va='bottom', fontweight='bold')
+        ax4.bar_label(bars4, labels=[f'{v:.0f}' for v in social_values], padding=3, fontweight='bold')
         
-        plt.suptitle(f'AI Impact Dashboard: {community_data["name"]}\n'
+        fig.suptitle(f'AI Impact Dashboard: {community_data["name"]}\n'
                     f'CNN+LSTM Renewable Energy Prediction System\n'
-                    f'Model Accuracy: PV {self.model_metrics["pv_r2"]:.1%}, Wind {self.model_metrics["wind_r2"]:.1%}', 
+                    f'Model Accuracy: PV {self.metrics.pv_r2:.1%}, Wind {self.metrics.wind_r2:.1%}', 
                     fontsize=14, fontweight='bold')
-        plt.tight_layout()
-        plt.show()
+        fig.tight_layout()
+        
+        if filename is None:
+            filename = f"AI_Dashboard_{community_data['name'].replace(' ', '_')}.png"
+        fig.savefig(filename, dpi=100, bbox_inches='tight')
+        print(f"💾 Dashboard saved as: {filename}")
+        if self.interactive:
+            plt.show()
         
         return fig
     
-    def run_interactive_report(self):
-        """Main function to run the interactive report generator"""
+    def run_interactive_report(self, community_data=None):
+        """Main function to run the interactive report generator; prompts unless community_data is given"""
         print("\n" + "="*60)
         print("🎯 AI FOR SOCIAL GOOD - RENEWABLE ENERGY REPORT GENERATOR")
         print("="*60)
         print(f"Using your CNN+LSTM model performance:")
-        print(f"• Solar Prediction: R² = {self.model_metrics['pv_r2']:.3f}")
-        print(f"• Wind Prediction: R² = {self.model_metrics['wind_r2']:.3f}")
-        print(f"• Architecture: {self.model_metrics['architecture']}")
+        print(f"• Solar Prediction: R² = {self.metrics.pv_r2:.3f}")
+        print(f"• Wind Prediction: R² = {self.metrics.wind_r2:.3f}")
+        print(f"• Architecture: {self.metrics.architecture}")
         print("\nThis tool will generate a personalized AI report for your community")
         print("based on your exceptional renewable energy prediction technology.\n")
         
         # Get user input
-        community_data = self.get_user_input()
+        if community_data is None:
+            community_data = self.get_user_input()
         
         # Calculate personalized impact
         print("\n🔮 Calculating personalized impact using your model metrics...")
@@ -440,15 +547,18 @@ Data Features: Time, Season, DHI, DNI, GHI, Wind_speed, Humidity, Temperature
         print("\n" + "="*70)
         print("📋 YOUR PERSONALIZED AI-GENERATED REPORT")
         print("="*70)
-        print(report)
+        # Written directly rather than via print, without copying the report to append the newline
+        sys.stdout.write(report)
+        sys.stdout.write("\n")
         
         # Generate visualization
+        file_stem = f"{community_data['name'].replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M')}"
         print("\n📊 Generating impact dashboard...")
-        self.generate_impact_dashboard(community_data, personalized_metrics)
+        self.generate_impact_dashboard(community_data, personalized_metrics, f"AI_Dashboard_{file_stem}.png")
         
         # Save report
-        filename = f"AI_Report_{community_data['name'].replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M')}.txt"
-        with open(filename, 'w', encoding='utf-8') as f:
+        filename = f"AI_Report_{file_stem}.txt"
+        with open(filename, 'w', encoding='utf-8', buffering=65536) as f:
             f.write(report)
         print(f"\n💾 Report saved as: {filename}")
         
@@ -457,5 +567,23 @@ Data Features: Time, Season, DHI, DNI, GHI, Wind_speed, Humidity, Temperature
 
 # Run the interactive report generator
 if __name__ == "__main__":
-    genai = InteractiveRenewableEnergyGenAI()
-    genai.run_interactive_report()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Interactive GenAI report generator for renewable energy")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--config', help="JSON file with the community information (skips the prompts)")
+    source.add_argument('--answers', help="File with one answer per prompt line, or '-' to read them from stdin")
+    parser.add_argument('--interactive', action='store_true', help="Also show the dashboard window after saving it")
+    args = parser.parse_args()
+    
+    genai = InteractiveRenewableEnergyGenAI(interactive=args.interactive)
+    community_data = None
+    if args.config:
+        try:
+            community_data = genai.load_community_config(args.config)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+    elif args.answers:
+        try:
+            genai.load_answers(args.answers)
+        except OSError as e:
+            parser.error(str(e))
+    genai.run_interactive_report(community_data)
\ No newline at end of file